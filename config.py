@@ -24,5 +24,13 @@ OUTPUT_FILE_TPL = "output/task_{0}_results.txt"
 
 WEATHER_DATA_URL = "https://www.fifeweather.co.uk/cowdenbeath/200606.csv"
 GET_WEATHER_TIMEOUT = 1.0
+DOWNLOAD_CHUNK_SIZE = 1 << 16
 
 WEATHER_FILENAME = "weather_data.csv"
+CSV_COLUMNS = {
+    "Date": str,
+    "Time": str,
+    "Outside Temperature": "float32",
+    "Hi Temperature": "float32",
+    "Low Temperature": "float32",
+}
@@ -5,3 +5,5 @@ LOW_TEMPERATURE_TO_COMPARE = 10.3
 LOW_TEMPERATURE_DELTA = 0.2
 
 AVG_JULY_TEMPERATURE = 25.0
+
+TOP_N_CANDIDATES = 64
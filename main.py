@@ -1,17 +1,23 @@
-import csv
+import argparse
 import datetime
 import itertools
 import logging
 import os
-from collections import Counter, defaultdict, namedtuple
+import shutil
+from collections import namedtuple
 from functools import wraps
 from logging.config import dictConfig
-from typing import List, Optional, Set, Tuple
+from typing import IO, Dict, List, Optional, Set, Tuple, Union
 
+import numpy as np
+import pandas as pd
 import requests
+from numba import njit, types
 from urllib3.exceptions import RequestError
 
 from config import (
+    CSV_COLUMNS,
+    DOWNLOAD_CHUNK_SIZE,
     GET_WEATHER_TIMEOUT,
     OUTPUT_FILE_TPL,
     WEATHER_DATA_URL,
@@ -24,6 +30,7 @@ from constants import (
     HI_TEMPERATURE_TO_COMPARE,
     LOW_TEMPERATURE_DELTA,
     LOW_TEMPERATURE_TO_COMPARE,
+    TOP_N_CANDIDATES,
 )
 
 dictConfig(log_config)
@@ -31,26 +38,95 @@ logger = logging.getLogger(__name__)
 
 
 def logging_deco(func):
+    name, doc = func.__name__, func.__doc__
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger.info(f"Func {func.__name__} ({func.__doc__}) starts")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Func %s (%s) starts", name, doc)
         result = func(*args, **kwargs)
-        logger.info(f"Func {func.__name__} finished with result {result}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Func %s finished", name)
         return result
 
     return wrapper
 
 
+@njit(
+    types.float32[::1](
+        types.Array(types.float32, 1, "C", readonly=True),
+        types.Array(types.boolean, 1, "C", readonly=True),
+        types.Array(types.float32, 1, "C", readonly=True),
+        types.float32,
+        types.float32,
+    ),
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+)
+def _forecast_kernel(june_out, july_known_mask, july_known_out, avg_june, avg_july):
+    """Forecast july temperatures following june pattern around the daily average"""
+    size = june_out.shape[0]
+    delta = 0.0
+    known = 0
+    for i in range(size):
+        if july_known_mask[i]:
+            delta += july_known_out[i] - (avg_july - (avg_june - june_out[i]))
+            known += 1
+    diff = delta / (size - known)
+
+    july_out = np.empty_like(june_out)
+    for i in range(size):
+        if july_known_mask[i]:
+            july_out[i] = july_known_out[i]
+        else:
+            july_out[i] = round(avg_july - (avg_june - june_out[i]) - diff, 1)
+    return july_out
+
+
 def download_weather_cvs() -> None:
     """Download csv file to local"""
+    # Download to a temporary file so an interrupted download never replaces the csv
+    tmp_filename = f"{WEATHER_FILENAME}.part"
     try:
         with requests.get(
             WEATHER_DATA_URL, stream=True, timeout=GET_WEATHER_TIMEOUT
-        ) as response, open(WEATHER_FILENAME, "wb") as f:
-            for line in response.iter_lines():
-                f.write(line + "\n".encode())
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(tmp_filename, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        os.replace(tmp_filename, WEATHER_FILENAME)
     except RequestError as e:
         logger.warning(f"Error while downloading csv file: {e}")
+    finally:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+
+
+def read_weather_csv(source: Union[str, IO[bytes]]) -> pd.DataFrame:
+    """Read weather csv from path or file object"""
+    df = pd.read_csv(source, usecols=list(CSV_COLUMNS), dtype=CSV_COLUMNS)
+    hours_minutes = df["Time"].str.split(":", n=1, expand=True).astype(np.int16)
+    df["Minutes"] = hours_minutes[0] * 60 + hours_minutes[1]
+    return df
+
+
+def fetch_and_parse() -> pd.DataFrame:
+    """Read csv straight from remote response without saving it to local"""
+    try:
+        with requests.get(
+            WEATHER_DATA_URL, stream=True, timeout=GET_WEATHER_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return read_weather_csv(response.raw)
+    except requests.RequestException:
+        logger.exception(f"Unable to fetch {WEATHER_DATA_URL}")
+        raise
+    except (pd.errors.ParserError, ValueError):
+        logger.exception(f"Unable to read {WEATHER_DATA_URL}. Bad format")
+        raise
 
 
 class WeatherSnippet(
@@ -73,17 +149,29 @@ class WeatherSnippet(
         """Difference between current temperature and average daily"""
         return self.date.avg_temperature - self.outside_temperature
 
-    def __eq__(self, other):
-        return self.time == other.time
-
 
 class Date(datetime.date):
     """Class to store information about days and links to time snippets"""
 
-    _unique_dates = set()
+    __slots__ = (
+        "time",
+        "outside_temperature",
+        "hi_temperature",
+        "low_temperature",
+        "_index_by_time",
+        "_max_temperature",
+        "_hottest_times_of_the_day",
+        "_avg_temperature",
+    )
+
+    _unique_dates: Dict[int, "Date"] = {}
 
     def __init__(self, *args, **kwargs):
-        self.weather_snippets: List[WeatherSnippet] = []
+        self.time: np.ndarray = np.empty(0, dtype=object)
+        self.outside_temperature: np.ndarray = np.empty(0, dtype=np.float32)
+        self.hi_temperature: np.ndarray = np.empty(0, dtype=np.float32)
+        self.low_temperature: np.ndarray = np.empty(0, dtype=np.float32)
+        self._index_by_time: Dict[str, int] = {}
         self._max_temperature: Optional[float] = None
         self._hottest_times_of_the_day: Optional[List[str]] = None
         self._avg_temperature: Optional[float] = None
@@ -98,33 +186,46 @@ class Date(datetime.date):
             logger.exception(f"Can't cast {string} to date using delimiter {delimiter}")
             raise
 
-        if _date in cls._unique_dates:
+        key = _date.toordinal()
+        existing = cls._unique_dates.get(key)
+        if existing is not None:
             logger.debug(f"Date {_date} already exists")
-            return next(filter(lambda x: x == _date, cls._unique_dates))
+            return existing
         else:
             logger.debug(f"Created new date {_date}")
-            cls._unique_dates.add(_date)
+            cls._unique_dates[key] = _date
             return _date
 
+    @property
+    def weather_snippets(self) -> List[WeatherSnippet]:
+        """Weather snippets of the day, materialized from arrays"""
+        return [self.snippet(idx) for idx in range(len(self.time))]
+
+    def snippet(self, idx: int) -> WeatherSnippet:
+        """Weather snippet at position idx of the day arrays"""
+        return WeatherSnippet(
+            date=self,
+            time=self.time[idx],
+            outside_temperature=self.outside_temperature[idx],
+            hi_temperature=self.hi_temperature[idx],
+            low_temperature=self.low_temperature[idx],
+        )
+
     @property
     def max_temperature(self) -> float:
         """Max temperature of the day"""
-        if not self._max_temperature:
-            self._max_temperature = max(
-                map(lambda x: x.outside_temperature, self.weather_snippets)
-            )
+        if self._max_temperature is None:
+            self._max_temperature = self.outside_temperature.max()
             logger.debug(f"Max temperature for {self} - {self._max_temperature}")
         return self._max_temperature
 
     @property
     def hottest_times_of_the_day(self) -> List[str]:
         """Times with hottest temperature"""
-        if not self._hottest_times_of_the_day:
-            self._hottest_times_of_the_day = [
-                snippet.time
-                for snippet in self.weather_snippets
-                if snippet.outside_temperature == self.max_temperature
-            ]
+        if self._hottest_times_of_the_day is None:
+            self._hottest_times_of_the_day = self.time[
+                self.outside_temperature == self.max_temperature
+            ].tolist()
             logger.debug(
                 f"{self} the hottest temperature {self.max_temperature} was at {self._hottest_times_of_the_day}"
             )
@@ -133,84 +234,181 @@ class Date(datetime.date):
     @property
     def avg_temperature(self) -> float:
         """Average temperature of the day"""
-        if not self._avg_temperature:
-            self._avg_temperature = sum(
-                map(lambda x: x.outside_temperature, self.weather_snippets)
-            ) / len(self.weather_snippets)
+        if self._avg_temperature is None:
+            self._avg_temperature = np.float32(
+                self.outside_temperature.mean(dtype=np.float64)
+            )
             logger.debug(f"Average temperature for {self} is {self._avg_temperature}")
         return self._avg_temperature
 
-    def get_eq_time(self, snippet: WeatherSnippet) -> WeatherSnippet:
+    def set_weather(
+        self,
+        time: np.ndarray,
+        outside_temperature: np.ndarray,
+        hi_temperature: np.ndarray,
+        low_temperature: np.ndarray,
+        max_temperature: Optional[float] = None,
+        avg_temperature: Optional[float] = None,
+    ) -> None:
+        """Attach weather arrays of the day, optionally with precomputed aggregates"""
+        self.time = time
+        self.outside_temperature = outside_temperature
+        self.hi_temperature = hi_temperature
+        self.low_temperature = low_temperature
+        self._index_by_time = {
+            snippet_time: idx for idx, snippet_time in enumerate(time.tolist())
+        }
+        self._max_temperature = max_temperature
+        self._hottest_times_of_the_day = None
+        self._avg_temperature = avg_temperature
+
+    def add_weather(
+        self,
+        time: np.ndarray,
+        outside_temperature: np.ndarray,
+        hi_temperature: np.ndarray,
+        low_temperature: np.ndarray,
+    ) -> None:
+        """Append weather arrays to the day and reset cached aggregates"""
+        for idx, snippet_time in enumerate(time.tolist(), start=len(self.time)):
+            self._index_by_time[snippet_time] = idx
+        self.time = np.append(self.time, time)
+        self.outside_temperature = np.append(
+            self.outside_temperature, outside_temperature
+        )
+        self.hi_temperature = np.append(self.hi_temperature, hi_temperature)
+        self.low_temperature = np.append(self.low_temperature, low_temperature)
+        self._max_temperature = None
+        self._hottest_times_of_the_day = None
+        self._avg_temperature = None
+
+    def index_of(self, time: str) -> Optional[int]:
+        """Position of time in the day arrays"""
+        return self._index_by_time.get(time)
+
+    def get_eq_time(self, snippet: WeatherSnippet) -> Optional[WeatherSnippet]:
         """Get weather snippet with same time"""
-        return next((s for s in self.weather_snippets if s == snippet), None)
+        idx = self.index_of(snippet.time)
+        return None if idx is None else self.snippet(idx)
 
 
 class WeatherHandler:
     """Handler for working with weather data"""
 
-    def __init__(self, snippets: List[WeatherSnippet], days: Set[Date]):
-        self.snippets: List[WeatherSnippet] = snippets
+    def __init__(self, days: Set[Date], data: pd.DataFrame):
         self.days: Set[Date] = days
+        self._date_all: np.ndarray = data["Date"].to_numpy(dtype=object)
+        self._time_all: np.ndarray = data["Time"].to_numpy(dtype=object)
+        self._outside_all: np.ndarray = data["Outside Temperature"].to_numpy()
+        self._hi_all: np.ndarray = data["Hi Temperature"].to_numpy()
+        self._low_all: np.ndarray = data["Low Temperature"].to_numpy()
+        self._date_month: np.ndarray = data["Month"].to_numpy(dtype=np.int8)
+        self._date_day: np.ndarray = data["Day"].to_numpy(dtype=np.int8)
+        self._time_minutes: np.ndarray = data["Minutes"].to_numpy(dtype=np.int16)
+
+    @property
+    def snippets(self) -> List[WeatherSnippet]:
+        """Weather snippets of all days in date order, materialized from arrays"""
+        return list(
+            itertools.chain.from_iterable(
+                day.weather_snippets for day in sorted(self.days)
+            )
+        )
 
     @classmethod
     def from_csv(cls) -> "WeatherHandler":
         """Create handler obj using csv file"""
         try:
-            snippets = []
-            _dates = set()
-            with open(WEATHER_FILENAME, newline="") as csvfile:
-                try:
-                    reader = csv.DictReader(csvfile)
-                except csv.Error:
-                    logger.exception(
-                        f"Unable to read file {WEATHER_FILENAME}. Bad format"
-                    )
-                    raise
-                for row in reader:
-                    _date = Date.from_string_uniq(row["Date"])
-                    snippet = WeatherSnippet(
-                        date=_date,
-                        time=row["Time"],
-                        outside_temperature=float(row["Outside Temperature"]),
-                        hi_temperature=float(row["Hi Temperature"]),
-                        low_temperature=float(row["Low Temperature"]),
-                    )
-                    _date.weather_snippets.append(snippet)
-                    _dates.add(_date)
-                    snippets.append(snippet)
-            logger.info(
-                f"Created handler to process {len(_dates)} dates and {len(snippets)} weather snippets"
-            )
-            return cls(snippets, _dates)
+            df = read_weather_csv(WEATHER_FILENAME)
         except FileNotFoundError:
             logger.exception(f"File {WEATHER_FILENAME} was not found")
             raise
+        except (pd.errors.ParserError, ValueError):
+            logger.exception(f"Unable to read file {WEATHER_FILENAME}. Bad format")
+            raise
+        return cls.from_dataframe(df)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "WeatherHandler":
+        """Create handler obj using dataframe read from weather csv"""
+        codes, date_strings = pd.factorize(df["Date"])
+        _dates = np.empty(len(date_strings), dtype=object)
+        _dates[:] = [Date.from_string_uniq(string) for string in date_strings]
+        ordinals = np.array([_date.toordinal() for _date in _dates], dtype=np.int64)
+
+        # Keep rows of the same date adjacent so daily values are contiguous slices
+        order = np.argsort(ordinals[codes], kind="stable")
+        df = df.iloc[order].reset_index(drop=True)
+        codes = codes[order]
+        df["Date"] = _dates[codes]
+        df["Day"] = np.array([_date.day for _date in _dates], dtype=np.int8)[codes]
+        df["Month"] = np.array([_date.month for _date in _dates], dtype=np.int8)[codes]
+        logger.info(
+            f"Created handler to process {len(_dates)} dates and {len(df)} weather snippets"
+        )
+        handler = cls(set(_dates), df)
+        handler._compute_daily(ordinals[codes])
+        return handler
+
+    def _compute_daily(self, ordinals: np.ndarray) -> None:
+        """Reduce daily aggregates over date sorted arrays and attach them to dates"""
+        self._day_starts: np.ndarray = np.flatnonzero(np.diff(ordinals, prepend=0))
+        self._day_counts: np.ndarray = np.diff(
+            np.append(self._day_starts, len(ordinals))
+        )
+        self._day_max: np.ndarray = np.maximum.reduceat(
+            self._outside_all, self._day_starts
+        )
+        # Sums are accumulated in float64 and only the means are stored as float32
+        self._day_mean: np.ndarray = (
+            np.add.reduceat(self._outside_all, self._day_starts, dtype=np.float64)
+            / self._day_counts
+        ).astype(np.float32)
+
+        for start, count, day_max, day_mean in zip(
+            self._day_starts.tolist(),
+            self._day_counts.tolist(),
+            self._day_max,
+            self._day_mean,
+        ):
+            stop = start + count
+            self._date_all[start].set_weather(
+                time=self._time_all[start:stop],
+                outside_temperature=self._outside_all[start:stop],
+                hi_temperature=self._hi_all[start:stop],
+                low_temperature=self._low_all[start:stop],
+                max_temperature=day_max,
+                avg_temperature=day_mean,
+            )
+
+        self._hot_mask: np.ndarray = self._outside_all == np.repeat(
+            self._day_max, self._day_counts
+        )
+        self._hot_time_counts: pd.Series = pd.Series(
+            self._time_all[self._hot_mask]
+        ).value_counts()
+        self._month_per_hot: np.ndarray = self._date_month[self._hot_mask]
+        self._minutes_per_hot: np.ndarray = self._time_minutes[self._hot_mask]
 
     @logging_deco
     def hottest_time_of_days(self) -> str:
         """What time of the day is the most commonly occurring hottest time"""
-        hottest_times = list(
-            itertools.chain.from_iterable(
-                [day.hottest_times_of_the_day for day in self.days]
-            )
+        logger.info(
+            f"Most common 5 hottest times: {list(self._hot_time_counts.head(5).items())}"
         )
-        counter = Counter(hottest_times)
-        logger.info(f"Most common 5 hottest times: {counter.most_common(5)}")
-        return counter.most_common(1)[0][0]
+        return self._hot_time_counts.index[0]
 
     @logging_deco
     def average_time_of_hottest_daily_temperature(self) -> Tuple[int, str]:
         """What is the average time of hottest daily temperature (over month)"""
-        hottest_time_by_month = defaultdict(list)
-        for day in self.days:
-            hottest_time_by_month[day.month].extend(day.hottest_times_of_the_day)
-
-        for month, times_of_hottest in hottest_time_by_month.items():
-            times_in_minutes = []
-            for elem in times_of_hottest:
-                hours, minutes = map(int, elem.split(":"))
-                times_in_minutes.append(hours * 60 + minutes)
-            avg_hottest_time = sum(times_in_minutes) / len(times_in_minutes)
+        sums = np.bincount(
+            self._month_per_hot, weights=self._minutes_per_hot, minlength=13
+        )
+        counts = np.bincount(self._month_per_hot, minlength=13)
+        averages = sums / np.maximum(counts, 1)
+
+        for month in np.flatnonzero(counts).tolist():
+            avg_hottest_time = averages[month]
             avg_hottest_time = (
                 f"{int(avg_hottest_time // 60)}: {int(avg_hottest_time % 60)}"
             )
@@ -219,23 +417,38 @@ class WeatherHandler:
     @logging_deco
     def top_n_hottest_times(self) -> str:
         """Which are the Top Ten hottest times on distinct days, preferably sorted by date order."""
-        snippets_sorted_by_max_temp = sorted(
-            self.snippets, key=lambda x: x.outside_temperature, reverse=True
-        )
-        days_used = set()
+        negated = -self._outside_all
+        window = min(TOP_N_CANDIDATES, len(negated))
         top_ten = []
-        for elem in snippets_sorted_by_max_temp:
-            if elem.date in days_used:
-                continue
-            top_ten.append(elem)
-            if len(top_ten) == 10:
-                break
-            days_used.add(elem.date)
+        while window:
+            # Partition out the hottest candidates, keeping every tie of the cutoff value
+            cutoff = np.partition(negated, window - 1)[window - 1]
+            candidates = np.flatnonzero(negated <= cutoff)
+            candidates = candidates[np.argsort(negated[candidates], kind="stable")]
+
+            days_used = set()
+            top_ten = []
+            for idx in candidates.tolist():
+                if self._date_all[idx] in days_used:
+                    continue
+                top_ten.append(idx)
+                if len(top_ten) == 10:
+                    break
+                days_used.add(self._date_all[idx])
 
-        return "\n".join(
-            f"Date: {elem.date}, Time: {elem.time}, Temperature {elem.outside_temperature}"
-            for elem in top_ten
-        )
+            if len(top_ten) == 10 or window == len(negated):
+                break
+            window = min(window * 4, len(negated))
+
+        lines = [
+            f"Date: {date}, Time: {time}, Temperature {temperature:.1f}"
+            for date, time, temperature in zip(
+                self._date_all[top_ten].tolist(),
+                self._time_all[top_ten].tolist(),
+                self._outside_all[top_ten].tolist(),
+            )
+        ]
+        return "\n".join(lines)
 
     @logging_deco
     def days_with_hi_and_low_in_iterval(self) -> str:
@@ -244,18 +457,31 @@ class WeatherHandler:
         where the “Hi Temperature” was within +/- 1 degree of 22.3 or the “Low Temperature” was
         within +/- 0.2 degree higher or lower of 10.3 over the first 9 days of June
         """
-        data = filter(
-            lambda x: abs(x.hi_temperature - HI_TEMPERATURE_TO_COMPARE)
-            <= HI_TEMPERATURE_DELTA
-            or abs(x.low_temperature - LOW_TEMPERATURE_TO_COMPARE)
-            <= LOW_TEMPERATURE_DELTA,
-            filter(lambda x: x.date.month == 6 and x.date.day < 10, self.snippets),
+        mask = (
+            (self._date_month == 6)
+            & (self._date_day < 10)
+            & (
+                (
+                    np.abs(self._hi_all - np.float32(HI_TEMPERATURE_TO_COMPARE))
+                    <= np.float32(HI_TEMPERATURE_DELTA)
+                )
+                | (
+                    np.abs(self._low_all - np.float32(LOW_TEMPERATURE_TO_COMPARE))
+                    <= np.float32(LOW_TEMPERATURE_DELTA)
+                )
+            )
         )
 
-        return "\n".join(
-            f"Date: {elem.date}, Time: {elem.time}, Hi: {elem.hi_temperature}, Low: {elem.low_temperature}"
-            for elem in data
-        )
+        lines = [
+            f"Date: {date}, Time: {time}, Hi: {hi:.1f}, Low: {low:.1f}"
+            for date, time, hi, low in zip(
+                self._date_all[mask].tolist(),
+                self._time_all[mask].tolist(),
+                self._hi_all[mask].tolist(),
+                self._low_all[mask].tolist(),
+            )
+        ]
+        return "\n".join(lines)
 
     @logging_deco
     def july_forecast(self):
@@ -265,55 +491,71 @@ class WeatherHandler:
             july_day = Date.from_string_uniq(
                 f"{june_day.day}/{june_day.month + 1}/{june_day.year}"
             )
-            if len(july_day.weather_snippets) == len(june_day.weather_snippets):
+            if len(july_day.time) == len(june_day.time):
                 logger.info(
                     f"There are already full set of weather snippets for {july_day}"
                 )
                 continue
 
-            # If there are aleady weather data for july day we have to calculate diff to keep average temperature
-            delta = 0
-            for snippet in july_day.weather_snippets:
-                june_eq = june_day.get_eq_time(snippet)
-                expected_value = AVG_JULY_TEMPERATURE - june_eq.diff_with_avg_temp()
-                current_delta = snippet.outside_temperature - expected_value
-                delta += current_delta
-            diff = delta / (
-                len(june_day.weather_snippets) - len(july_day.weather_snippets)
+            # Weather data already present for july day is passed to the kernel to keep average temperature
+            july_positions = [
+                july_day.index_of(time) for time in june_day.time.tolist()
+            ]
+            known_mask = np.array(
+                [idx is not None for idx in july_positions], dtype=np.bool_
             )
-            logger.debug(
-                f"Diff to remove from outside temperature for {july_day} is {diff}"
+            known_out = np.zeros(len(june_day.time), dtype=np.float32)
+            known_out[known_mask] = july_day.outside_temperature[
+                [idx for idx in july_positions if idx is not None]
+            ]
+            july_out = _forecast_kernel(
+                june_day.outside_temperature,
+                known_mask,
+                known_out,
+                june_day.avg_temperature,
+                np.float32(AVG_JULY_TEMPERATURE),
             )
 
-            for june_time in june_day.weather_snippets:
-                if june_time in july_day.weather_snippets:
-                    continue
-                july_time = WeatherSnippet(
-                    date=july_day,
-                    time=june_time.time,
-                    outside_temperature=round(
-                        AVG_JULY_TEMPERATURE - june_time.diff_with_avg_temp() - diff, 1
-                    ),
-                    hi_temperature=june_day.avg_temperature,  # Not necessary to fill it
-                    low_temperature=june_day.avg_temperature,  # Not necessary to fill it
-                )
-                july_day.weather_snippets.append(july_time)
-                self.snippets.append(july_time)
+            unknown_mask = ~known_mask
+            # Hi and low temperatures are not necessary to fill
+            fill = np.full(
+                np.count_nonzero(unknown_mask),
+                june_day.avg_temperature,
+                dtype=np.float32,
+            )
+            july_day.add_weather(
+                time=june_day.time[unknown_mask],
+                outside_temperature=july_out[unknown_mask],
+                hi_temperature=fill,
+                low_temperature=fill,
+            )
             self.days.add(july_day)
             logger.debug(
                 f"Avg temperature for {july_day} is {july_day.avg_temperature}"
             )
 
-        for t in sorted(
-            filter(lambda x: x.date.month == 7, self.snippets),
-            key=lambda x: (x.date, x.time),
-        ):
-            yield f"{t.date} {t.time} {t.outside_temperature}\n"
+        for day in sorted(filter(lambda x: x.month == 7, self.days)):
+            order = np.argsort(day.time, kind="stable")
+            for time, temperature in zip(
+                day.time[order].tolist(), day.outside_temperature[order].tolist()
+            ):
+                yield f"{day} {time} {temperature:.1f}\n"
 
 
 if __name__ == "__main__":
-    download_weather_cvs()
-    handler = WeatherHandler.from_csv()
+    parser = argparse.ArgumentParser(description="Weather data reports")
+    parser.add_argument(
+        "--save-local",
+        action="store_true",
+        help=f"save downloaded csv to {WEATHER_FILENAME} and read it from there",
+    )
+    args = parser.parse_args()
+
+    if args.save_local:
+        download_weather_cvs()
+        handler = WeatherHandler.from_csv()
+    else:
+        handler = WeatherHandler.from_dataframe(fetch_and_parse())
 
     try:
         os.mkdir(OUTPUT_FILE_TPL.split("/")[0])